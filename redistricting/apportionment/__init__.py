@@ -2,10 +2,12 @@
 
 from .apportionment import ApportionmentMethod
 from .apportionment import apportion_representatives
+from .apportionment import apportion_sweep
 from .apportionment import huntington_hill
 
 __all__ = [
     "ApportionmentMethod",
     "apportion_representatives",
+    "apportion_sweep",
     "huntington_hill"
 ]
@@ -0,0 +1,52 @@
+"""Ahead-of-time compile the Huntington-Hill seat loop with Numba.
+
+Just-in-time compiling the seat loop costs more on first use than a whole
+apportionment does. Running this module once builds the loop into the
+``_hh_kernel`` extension module beside it, which is then used in place of
+the just-in-time version with no compilation at runtime:
+
+    python -m redistricting.apportionment._kernel_compile
+
+The extension also records a fingerprint of the seat loops it was built
+from. Once those loops change, it is ignored until this module is run again.
+
+Numba is only needed to run this module, not to use its output. Note that
+``numba.pycc`` is itself deprecated, so running this module emits a
+``NumbaPendingDeprecationWarning``.
+"""
+
+import os
+
+# numba.pycc is untyped and does not declare CC as an export, so the
+# strict type checks are silenced for these calls only.
+from numba.pycc import CC  # type: ignore[attr-defined]
+
+from .apportionment import _hh_allocate_argmax
+from .apportionment import _hh_allocate_argmax_default
+from .apportionment import _hh_kernel_version
+
+# Fingerprint of the seat loops being compiled. apportionment checks it
+# against the current seat loops before using the built extension.
+KERNEL_VERSION = _hh_kernel_version()
+
+
+def _kernel_version() -> int:
+    """Return the fingerprint of the compiled seat loops."""
+    return KERNEL_VERSION
+
+
+cc = CC("_hh_kernel")  # type: ignore[no-untyped-call]
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export(  # type: ignore[no-untyped-call]
+    "hh_allocate", "void(f8[:], i8[:], i8, i8)"
+)(_hh_allocate_argmax)
+cc.export(  # type: ignore[no-untyped-call]
+    "hh_allocate_default", "void(f8[:], i8[:], i8)"
+)(_hh_allocate_argmax_default)
+cc.export(  # type: ignore[no-untyped-call]
+    "kernel_version", "i8()"
+)(_kernel_version)
+
+
+if __name__ == "__main__":
+    cc.compile()
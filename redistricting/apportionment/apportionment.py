@@ -1,18 +1,39 @@
 """Contains functions used in apportioning representatives."""
 
+import hashlib
+import heapq
+import importlib
+import inspect
+import os
+
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
 from enum import StrEnum
 from math import sqrt
+from typing import Any, Optional
 
-from typing import cast
-
+import numpy as np
+import numpy.typing as npt
 from pandas import DataFrame
 
 from .. import data_loading
-from .. import data_cleaning
 
 POP_COL = "POP20"
 REPS_COL = "reps"
 
+# A single apportionment takes well under a millisecond, while starting
+# worker processes and sending dataframes between them costs far more.
+# Sweeps up to this many configurations are run in this process instead.
+SERIAL_SWEEP_SIZE = 2000
+
+# Geometric means sqrt(n * (n + 1)) of consecutive representative counts,
+# indexed by n. No state comes near this many representatives in practice;
+# larger counts fall back to computing the square root.
+_GEOMETRIC_MEANS = np.sqrt(
+    np.arange(1001, dtype=np.float64) * np.arange(1, 1002, dtype=np.float64)
+)
+_GEOMETRIC_MEANS_LIST: list[float] = _GEOMETRIC_MEANS.tolist()
+
 class ApportionmentMethod(StrEnum):
     """Possible Apportionment methods."""
 
@@ -49,19 +70,363 @@ def apportion_representatives(
     """
     states = data_loading.load_state_data()
 
+    # Drop the unwanted territories with a single mask. Selecting with the
+    # mask always makes a new dataframe, so the cached, shared state table
+    # is never worked on directly.
+    keep = np.ones(len(states), dtype=bool)
     if not include_dc:
-        states = data_cleaning.apportionment_drop_dc(states)
-
+        keep &= (states["ABBR"] != "DC").to_numpy()
     if not include_pr:
-        states = data_cleaning.apportionment_drop_pr(states)
+        keep &= (states["ABBR"] != "PR").to_numpy()
+    states = states[keep]
+
+    try:
+        apportion = _METHODS[method]
+    except KeyError as exc:
+        raise ValueError(f"Unknown apportionment method: {method}") from exc
+
+    return apportion(states, min_total_reps, min_state_reps)
+
+
+def _apportion_from_parameters(parameters: Mapping[str, Any]) -> DataFrame:
+    """Apportion representatives from a mapping of keyword arguments."""
+    return apportion_representatives(**parameters)
+
+
+def apportion_sweep(
+        param_grid: Iterable[Mapping[str, Any]],
+        max_workers: Optional[int] = None
+    ) -> list[DataFrame]:
+    """Apportion representatives for many configurations.
+
+    Each configuration is independent, so large sweeps are spread across
+    worker processes. This only pays off for very large grids: smaller ones,
+    of up to SERIAL_SWEEP_SIZE configurations, are run one after another in
+    this process, which is faster than starting the workers at all.
+
+    Parameters
+    ----------
+    param_grid : Iterable[Mapping[str, Any]]
+        Keyword arguments for apportion_representatives, one per
+        configuration
+    max_workers : Optional[int]
+        Most worker processes to use. Defaults to the number of processors.
+
+    Returns
+    -------
+    list[pandas.DataFrame]
+        Apportioned states tables, in the order of param_grid
+
+    """
+    param_grid = list(param_grid)
+    workers = max_workers if max_workers is not None else os.cpu_count()
+    if workers is None or workers <= 1 or len(param_grid) <= SERIAL_SWEEP_SIZE:
+        return [
+            _apportion_from_parameters(parameters)
+            for parameters in param_grid
+        ]
+
+    # Make sure the state data table exists before the workers start, so
+    # that they do not all try to create it at once. Workers that are forked
+    # also inherit the loaded table.
+    data_loading.load_state_data()
+
+    # Configurations are sent to the workers in batches, a few per worker,
+    # rather than one at a time, so that the cost of passing work and
+    # results between processes is shared across many apportionments.
+    chunksize = max(1, len(param_grid) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            _apportion_from_parameters, param_grid, chunksize=chunksize
+        ))
+
+
+def _hh_divisor_allocation(
+        pop: npt.NDArray[np.float64],
+        divisor: float
+    ) -> npt.NDArray[np.int64]:
+    """Return the Huntington-Hill allocation for a given divisor.
+
+    A state receives one seat for free, then one more for every seat whose
+    priority is strictly greater than the divisor.
+
+    Parameters
+    ----------
+    pop : numpy.ndarray
+        Population of each state
+    divisor : float
+        Population per representative used to round the quotas
+
+    Returns
+    -------
+    numpy.ndarray
+        Representatives of each state under this divisor
+
+    """
+    # All seats below the floor of the quota have priorities comfortably
+    # above the divisor. Only the seat at the floor needs an explicit check,
+    # which is written exactly as the seat loops compute priorities so that
+    # the two always agree.
+    n: npt.NDArray[np.int64] = np.maximum(
+        np.floor(pop / divisor).astype(np.int64), 1
+    )
+    next_seat_wanted: npt.NDArray[np.bool_] = (
+        pop / np.sqrt(n * (n + 1)) > divisor
+    )
+    return n + next_seat_wanted
+
+
+def _hh_initial_allocation(
+        pop: npt.NDArray[np.float64],
+        total_reps: int
+    ) -> npt.NDArray[np.int64]:
+    """Award the bulk of the seats at once by the divisor method.
+
+    Huntington-Hill by priority is equivalent to a divisor method rounding at
+    the geometric mean. Bisecting on the divisor finds an allocation of no
+    more than total_reps seats that the priority loop would also have
+    reached, leaving only a handful of seats to award one at a time.
+
+    Parameters
+    ----------
+    pop : numpy.ndarray
+        Population of each state
+    total_reps : int
+        Number of seats the allocation must not exceed
+
+    Returns
+    -------
+    numpy.ndarray
+        Representatives of each state, at least one each
+
+    """
+    reps = np.ones(pop.size, dtype=np.int64)
+    total_pop = float(pop.sum())
+    if total_reps <= pop.size or total_pop <= 0:
+        return reps
+
+    # A divisor above every population leaves each state with its single
+    # free seat. A divisor of total_pop / (total_reps + N) leaves quotas
+    # that already sum to at least total_reps.
+    high = 2 * float(pop.max())
+    low = total_pop / (total_reps + pop.size)
+    divisor = total_pop / total_reps
+
+    for _ in range(64):
+        allocation = _hh_divisor_allocation(pop, divisor)
+        allocated = int(allocation.sum())
+        if allocated <= total_reps:
+            reps = allocation
+            high = divisor
+            if allocated == total_reps:
+                break
+        else:
+            low = divisor
+        divisor = (low + high) / 2
+
+    return reps
+
+
+def _hh_allocate_argmax(
+        pop: npt.NDArray[np.float64],
+        reps: npt.NDArray[np.int64],
+        remaining: int,
+        min_state_reps: int
+    ) -> None:
+    """Award seats one at a time by Huntington-Hill priority, in place.
+
+    Parameters
+    ----------
+    pop : numpy.ndarray
+        Population of each state
+    reps : numpy.ndarray
+        Current representatives of each state, updated in place
+    remaining : int
+        Number of seats left to award
+    min_state_reps : int
+        Least allowable number of representatives in one state
+
+    """
+    # The Huntington-Hill priority of a state is its population divided by
+    # the geometric mean of its current and next number of representatives.
+    priority = pop / np.sqrt(reps * (reps + 1))
+
+    # Representatives only ever grow one at a time, so rather than scanning
+    # for the minimum every seat, count the states that are still short of
+    # it as they cross it. The loop condition is then two integer checks.
+    below_min = (reps < min_state_reps).sum()
+
+    while remaining > 0 or below_min > 0:
+        i = np.argmax(priority)
+        reps[i] += 1
+        n = reps[i]
+        if n < _GEOMETRIC_MEANS.size:
+            priority[i] = pop[i] / _GEOMETRIC_MEANS[n]
+        else:
+            priority[i] = pop[i] / sqrt(n * (n + 1))
+        remaining -= 1
+
+        if n == min_state_reps:
+            below_min -= 1
+
+
+def _hh_allocate_argmax_default(
+        pop: npt.NDArray[np.float64],
+        reps: npt.NDArray[np.int64],
+        remaining: int
+    ) -> None:
+    """Award a fixed number of seats by Huntington-Hill priority, in place.
+
+    Specialization of the argmax loop for the usual case where no state
+    needs more than its free seat, so there is no minimum to check.
+
+    Parameters
+    ----------
+    pop : numpy.ndarray
+        Population of each state
+    reps : numpy.ndarray
+        Current representatives of each state, updated in place
+    remaining : int
+        Number of seats left to award
+
+    """
+    priority = pop / np.sqrt(reps * (reps + 1))
+
+    for _ in range(remaining):
+        i = np.argmax(priority)
+        reps[i] += 1
+        n = reps[i]
+        if n < _GEOMETRIC_MEANS.size:
+            priority[i] = pop[i] / _GEOMETRIC_MEANS[n]
+        else:
+            priority[i] = pop[i] / sqrt(n * (n + 1))
+
+
+def _hh_allocate_heap(
+        pop: npt.NDArray[np.float64],
+        reps: npt.NDArray[np.int64],
+        remaining: int,
+        min_state_reps: int
+    ) -> None:
+    """Award seats one at a time from a max-heap of priorities, in place.
+
+    Equivalent to the argmax loop, but each seat costs O(log N) rather than
+    a full scan of the states. Ties are broken by the lowest state index, as
+    with numpy.argmax.
+
+    Parameters
+    ----------
+    pop : numpy.ndarray
+        Population of each state
+    reps : numpy.ndarray
+        Current representatives of each state, updated in place
+    remaining : int
+        Number of seats left to award
+    min_state_reps : int
+        Least allowable number of representatives in one state
+
+    """
+    # heapq is a min-heap, so priorities are stored negated. The loop runs
+    # in the interpreter, so it works on plain Python numbers throughout.
+    # The starting priorities are computed in one vectorized pass.
+    pop_list = pop.tolist()
+    geometric_means = _GEOMETRIC_MEANS_LIST
+    priorities = -pop / np.sqrt(reps * (reps + 1))
+    heap = [(p, i) for i, p in enumerate(priorities.tolist())]
+    heapq.heapify(heap)
 
-    if method == ApportionmentMethod.HHILL:
-        return huntington_hill(states, min_total_reps, min_state_reps)
+    # Rather than scanning for the minimum every seat, count the states that
+    # are still short of the minimum as they cross it.
+    below_min = int((reps < min_state_reps).sum())
+
+    while remaining > 0 or below_min > 0:
+        _, i = heapq.heappop(heap)
+        n = int(reps[i]) + 1
+        reps[i] = n
+        if n == min_state_reps:
+            below_min -= 1
+        if n < len(geometric_means):
+            geometric_mean = geometric_means[n]
+        else:
+            geometric_mean = sqrt(n * (n + 1))
+        heapq.heappush(heap, (-pop_list[i] / geometric_mean, i))
+        remaining -= 1
+
+
+def _hh_allocate_heap_default(
+        pop: npt.NDArray[np.float64],
+        reps: npt.NDArray[np.int64],
+        remaining: int
+    ) -> None:
+    """Award a fixed number of seats from a max-heap of priorities, in place.
+
+    With no minimum, the heap loop's minimum bookkeeping never fires, so this
+    simply runs it with a minimum of zero.
+
+    Parameters
+    ----------
+    pop : numpy.ndarray
+        Population of each state
+    reps : numpy.ndarray
+        Current representatives of each state, updated in place
+    remaining : int
+        Number of seats left to award
+
+    """
+    _hh_allocate_heap(pop, reps, remaining, 0)
+
+
+def _hh_kernel_version() -> int:
+    """Return a fingerprint of the seat loops built by _kernel_compile.
+
+    The fingerprint is compiled into the extension, so a build left over
+    from an older version of the seat loops can be recognized and skipped.
+
+    Returns
+    -------
+    int
+        A hash of the source of the argmax seat loops, as a signed 64 bit
+        integer
+
+    Raises
+    ------
+    OSError
+        The source of the seat loops is not available
+
+    """
+    source = "".join(
+        inspect.getsource(seat_loop)
+        for seat_loop in (_hh_allocate_argmax, _hh_allocate_argmax_default)
+    )
+    digest = hashlib.sha256(source.encode()).digest()
+    return int.from_bytes(digest[:8], "little", signed=True)
+
+
+# Numba is optional. If the seat loop has been compiled ahead of time by
+# _kernel_compile, use that. Failing that, when Numba is installed the argmax
+# loop is compiled so that no interpreter dispatch happens per seat.
+# Otherwise the heap is the cheaper of the two loops to run in the
+# interpreter. The built extension is imported by name since it only exists
+# once _kernel_compile has been run. An extension built from different seat
+# loops than the ones above, or whose version cannot be checked, is stale
+# and is passed over in the same way as a missing one.
+try:
+    _hh_kernel = importlib.import_module("._hh_kernel", __package__)
+    if _hh_kernel.kernel_version() != _hh_kernel_version():
+        raise ImportError("_hh_kernel was built from other seat loops")
+    _hh_allocate = _hh_kernel.hh_allocate
+    _hh_allocate_default = _hh_kernel.hh_allocate_default
+except (ImportError, AttributeError, OSError):
+    try:
+        import numba
+    except ImportError:
+        _hh_allocate = _hh_allocate_heap
+        _hh_allocate_default = _hh_allocate_heap_default
     else:
-        # No options for now. Unlikely to be others, as Huntington-Hill method
-        # is well established and optimal. Redundancy here for potential
-        # changes.
-        return huntington_hill(states, min_total_reps, min_state_reps)
+        _hh_allocate = numba.njit(cache=True)(_hh_allocate_argmax)
+        _hh_allocate_default = numba.njit(cache=True)(
+            _hh_allocate_argmax_default
+        )
 
 
 def huntington_hill(
@@ -88,29 +453,40 @@ def huntington_hill(
         A dataframe of states with representatives appropriately apportioned.
 
     """
-    tmp_df = population_df.copy()
-    tmp_df[REPS_COL] = 1
+    # Seat-by-seat allocation is a tight loop over a few dozen states, so we
+    # run it on bare NumPy arrays rather than paying for pandas label lookups
+    # on every seat. The population table itself is never copied or changed;
+    # the results are added as new columns of the returned dataframe. The
+    # seat loops scan these arrays every seat, so make sure they are
+    # contiguous float64 buffers rather than strided views.
+    pop = np.ascontiguousarray(
+        population_df[POP_COL].to_numpy(dtype=np.float64)
+    )
+    reps_arr = _hh_initial_allocation(pop, min_total_reps)
 
-    reps = max(0, min_total_reps - tmp_df[REPS_COL].sum())
+    remaining = max(0, min_total_reps - int(reps_arr.sum()))
 
-    tmp_df = tmp_df.assign(
-        avg_district_pop = lambda df_: (df_[POP_COL]
-            .div(
-                (df_[REPS_COL] * (df_[REPS_COL] + 1)).pow(0.5)
-            )
-        )
-    )
+    # Every state starts with at least one representative, so a minimum of
+    # one or less never needs checking and a fixed number of seats is left.
+    if min_state_reps <= 1:
+        _hh_allocate_default(pop, reps_arr, remaining)
+    else:
+        _hh_allocate(pop, reps_arr, remaining, min_state_reps)
 
-    while reps > 0 or tmp_df[REPS_COL].min() < min_state_reps:
-        next_state_id = tmp_df.avg_district_pop.idxmax(axis=0)
-        r: int = cast(int, tmp_df.loc[next_state_id, REPS_COL])
-        r += 1
-        tmp_df.loc[next_state_id, REPS_COL] = r
-        p: int = cast(int, tmp_df.loc[next_state_id, POP_COL])
-        n: int = cast(int, tmp_df.loc[next_state_id, REPS_COL])
-        tmp_df.loc[next_state_id, "avg_district_pop"] = p/sqrt(n*(n+1))
-        reps -= 1
+    return population_df.assign(**{
+        REPS_COL: reps_arr,
+        "avg_district_pop": np.round(pop / reps_arr),
+    })
 
-    tmp_df["avg_district_pop"] = tmp_df[POP_COL].div(tmp_df[REPS_COL]).round()
 
-    return tmp_df
+# Apportionment functions by method. Only Huntington-Hill for now, as it is
+# well established and optimal, but other methods slot in here. Dispatch is a
+# single hash lookup rather than a chain of enum comparisons, and because
+# ApportionmentMethod is a StrEnum its members hash as their string values,
+# so a plain string such as "huntington_hill" finds the same entry.
+_METHODS: dict[
+    ApportionmentMethod,
+    Callable[[DataFrame, int, int], DataFrame]
+] = {
+    ApportionmentMethod.HHILL: huntington_hill,
+}
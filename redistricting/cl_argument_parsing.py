@@ -1,6 +1,7 @@
 """All functions relating to parsing command line arguments."""
 
 import sys
+import weakref
 
 from pandas import DataFrame
 
@@ -9,6 +10,46 @@ ABBR="ABBR"
 STATE="STATE"
 FIPS_LEN=2
 
+_StateLookup = tuple[dict[int, int], dict[str, int], dict[str, int]]
+
+# Lookup tables for the most recent state dataframe, keyed by its id. The
+# dataframe is held by weak reference so that a new dataframe reusing the
+# same id is never mistaken for it. Only one entry is ever kept.
+_LOOKUP_CACHE: dict[int, tuple["weakref.ref[DataFrame]", _StateLookup]] = {}
+
+
+def _state_lookup_tables(state_df: DataFrame) -> _StateLookup:
+    """Return dictionaries mapping FIPS ids, abbreviations and names to FIPS.
+
+    The tables for the most recently seen dataframe are cached, so repeated
+    lookups against the same state dataframe only build them once.
+
+    Parameters
+    ----------
+    state_df: pandas.core.frame.DataFrame
+        A dataframe where we can look up a state's FIPS id
+
+    Returns
+    -------
+    tuple of dict
+        FIPS, abbreviation, and state name lookup tables, in that order
+
+    """
+    cached = _LOOKUP_CACHE.get(id(state_df))
+    if cached is not None and cached[0]() is state_df:
+        return cached[1]
+
+    fips = [int(fips_id) for fips_id in state_df[FIPS].tolist()]
+    tables = (
+        dict(zip(fips, fips)),
+        dict(zip(state_df[ABBR].tolist(), fips)),
+        dict(zip(state_df[STATE].tolist(), fips)),
+    )
+    _LOOKUP_CACHE.clear()
+    _LOOKUP_CACHE[id(state_df)] = (weakref.ref(state_df), tables)
+    return tables
+
+
 def parse_state(
         state_arg: str,
         state_df: DataFrame
@@ -33,14 +74,16 @@ def parse_state(
         The FIPS id of the state we want
 
     """
+    fips_map, abbr_map, name_map = _state_lookup_tables(state_df)
+
     if state_arg.isdigit() and len(state_arg) <= FIPS_LEN:
-        state_entry = state_df[state_df[FIPS] == int(state_arg)]
+        state_fips = fips_map.get(int(state_arg))
     elif len(state_arg) == FIPS_LEN:
-        state_entry = state_df[state_df[ABBR] == state_arg.upper()]
+        state_fips = abbr_map.get(state_arg.upper())
     else:
-        state_entry = state_df[state_df[STATE] == state_arg.title()]
+        state_fips = name_map.get(state_arg.title())
 
-    if not state_entry.empty:
-        state_id = str(state_entry[FIPS].iloc[0]).zfill(2)
+    if state_fips is not None:
+        state_id = str(state_fips).zfill(2)
         return state_id
     sys.exit(1)
@@ -1,43 +1,48 @@
 """All functions that handle configuration file parsing."""
 
-from .census_blocks_config import census_blocks_directory
-from .census_blocks_config import census_blocks_filename
-from .census_blocks_config import census_blocks_location
-from .census_blocks_config import census_blocks_url
-
-from .country_data_config import country_data_directory
-from .country_data_config import country_data_filename
-from .country_data_config import country_data_location
-
-
-from .downloads_config import downloads_directory
+import importlib
+import sys
 
+from typing import TYPE_CHECKING, Any
 
+from .config import clear_config_cache
 from .config import ensure_config
+from .config import register_cache_clearer
 from .config import Config
 
+# The accessor submodules are only imported when one of their functions is
+# first used, through __getattr__ below. The imports here let type checkers
+# and editors see the same names as if they were imported eagerly.
+if TYPE_CHECKING:
+    from .census_blocks_config import census_blocks_directory
+    from .census_blocks_config import census_blocks_filename
+    from .census_blocks_config import census_blocks_location
+    from .census_blocks_config import census_blocks_url
 
-from .fips_identifiers_config import fips_identifiers_directory
-from .fips_identifiers_config import fips_identifiers_filename
-from .fips_identifiers_config import fips_identifiers_location
-from .fips_identifiers_config import fips_identifiers_url
+    from .country_data_config import country_data_directory
+    from .country_data_config import country_data_filename
+    from .country_data_config import country_data_location
 
+    from .downloads_config import downloads_directory
 
-from .state_data_config import state_data_directory
-from .state_data_config import state_data_filename
-from .state_data_config import state_data_location
+    from .fips_identifiers_config import fips_identifiers_directory
+    from .fips_identifiers_config import fips_identifiers_filename
+    from .fips_identifiers_config import fips_identifiers_location
+    from .fips_identifiers_config import fips_identifiers_url
 
+    from .state_data_config import state_data_directory
+    from .state_data_config import state_data_filename
+    from .state_data_config import state_data_location
 
-from .state_population_config import state_population_directory
-from .state_population_config import state_population_filename
-from .state_population_config import state_population_location
-from .state_population_config import state_population_url
+    from .state_population_config import state_population_directory
+    from .state_population_config import state_population_filename
+    from .state_population_config import state_population_location
+    from .state_population_config import state_population_url
 
-
-from .state_shapes_config import state_shapes_directory
-from .state_shapes_config import state_shapes_filename
-from .state_shapes_config import state_shapes_location
-from .state_shapes_config import state_shapes_url
+    from .state_shapes_config import state_shapes_directory
+    from .state_shapes_config import state_shapes_filename
+    from .state_shapes_config import state_shapes_location
+    from .state_shapes_config import state_shapes_url
 
 
 __all__ = [
@@ -46,6 +51,7 @@ __all__ = [
     "census_blocks_filename",
     "census_blocks_location",
     "census_blocks_url",
+    "clear_config_cache",
     "country_data_directory",
     "country_data_filename",
     "country_data_location",
@@ -67,3 +73,79 @@ __all__ = [
     "state_shapes_location",
     "state_shapes_url",
 ]
+
+
+# Each accessor lives in the submodule named after its resource, e.g.
+# state_shapes_url in state_shapes_config.
+_ACCESSOR_MODULES = {
+    name: name.rsplit("_", 1)[0] + "_config"
+    for name in __all__
+    if name not in ("Config", "clear_config_cache", "ensure_config")
+}
+
+# Accessors that take no arguments besides the config. Each is also exposed
+# as an upper-case module constant holding its value for the project config
+# file, e.g. STATE_SHAPES_URL for state_shapes_url().
+_CONSTANT_ACCESSORS = frozenset(
+    name for name in _ACCESSOR_MODULES
+    if not (name.startswith("census_blocks_")
+            and name != "census_blocks_directory")
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import accessors and resolve constants on first access.
+
+    An accessor is imported from its submodule the first time it is used.
+    A constant is computed from its accessor for the project config file.
+    Either is then stored as a module attribute, so later reads are plain
+    attribute lookups.
+
+    Parameters
+    ----------
+    name : str
+        Name of the requested module attribute
+
+    Returns
+    -------
+    Any
+        The accessor function, or the configured value of a constant
+
+    Raises
+    ------
+    AttributeError
+        There is no such accessor or constant
+
+    """
+    module_name = _ACCESSOR_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f".{module_name}", __name__)
+        accessor = getattr(module, name)
+        globals()[name] = accessor
+        return accessor
+
+    accessor_name = name.lower()
+    if not name.isupper() or accessor_name not in _CONSTANT_ACCESSORS:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    # Going through the module object imports the accessor if needed.
+    value: str = getattr(sys.modules[__name__], accessor_name)()
+    globals()[name] = value
+    return value
+
+
+def _forget_constants() -> None:
+    """Drop the stored constants, so they are computed again when used."""
+    module_globals = globals()
+    for accessor_name in _CONSTANT_ACCESSORS:
+        module_globals.pop(accessor_name.upper(), None)
+
+
+register_cache_clearer(_forget_constants)
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including accessors not yet imported."""
+    return sorted(set(globals()) | set(__all__))
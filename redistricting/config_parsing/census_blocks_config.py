@@ -1,13 +1,19 @@
 """Utilities for parsing census_blocks configuration."""
 
+import collections
 import os
-import urllib.parse
 
 from typing import Optional
 
-from .config import Config, ConfigParseError, ensure_config
+from .config import Config, ConfigParseError
+from .config import cache_project_config, ensure_config
 
+# Census files name states by their two digit, zero padded FIPS code. Every
+# FIPS code in use is below 100, so the padded strings are built once here
+# and looked up rather than formatted again for every file.
+_FIPS_STR = tuple(f"{fips_id:02}" for fips_id in range(100))
 
+@cache_project_config
 def census_blocks_directory(config: Optional[Config] = None) -> str:
     """Return the directory for census block files.
 
@@ -30,19 +36,17 @@ def census_blocks_directory(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        directory = os.path.join(
-            config["saved_data"]["directory"],
-            config["saved_data"]["state_census_blocks"]["directory"]
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(directory, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        saved_data = config["saved_data"]
+        data_directory = saved_data["directory"]
+        subdirectory = saved_data["state_census_blocks"]["directory"]
+        # An f-string always produces a string, so no further check on the
+        # type of the directory is needed.
+        directory = f"{data_directory}{os.sep}{subdirectory}"
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("census blocks directory") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -50,6 +54,7 @@ def census_blocks_directory(config: Optional[Config] = None) -> str:
     return directory
 
 
+@cache_project_config
 def census_blocks_filename(
         fips_id: int,
         config: Optional[Config] = None
@@ -58,7 +63,7 @@ def census_blocks_filename(
 
     Parameters
     ----------
-    fips_id : int
+    fips_id : str or int
         FIPS id of the state whose block is requested
     config : Optional[dict]
         Optional configuration dictionary
@@ -77,22 +82,33 @@ def census_blocks_filename(
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        census_block_config = config["census_urls"]["census_blocks"]
+        census_urls = config["census_urls"]
+        census_block_config = census_urls["census_blocks"]
         filename_template = census_block_config["filename_template"]
-        filename = filename_template.format(
-            directory_year = census_block_config["directory_year"],
-            census_year_short = config["census_urls"]["census_year_short"],
-            state_fips = f"{fips_id:02}",
+        # FIPS ids may also be given as strings, such as "06", which are
+        # formatted directly.
+        if isinstance(fips_id, int) and 0 <= fips_id < len(_FIPS_STR):
+            state_fips = _FIPS_STR[fips_id]
+        else:
+            state_fips = f"{fips_id:02}"
+
+        # Most template fields are keys of the census blocks section, so it
+        # is chained behind the few values that come from elsewhere rather
+        # than copying its values out one at a time.
+        filename = filename_template.format_map(
+            collections.ChainMap(
+                {
+                    "census_year_short": census_urls["census_year_short"],
+                    "state_fips": state_fips,
+                },
+                census_block_config,
+            )
         )
 
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(filename, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("census blocks filename") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -100,6 +116,7 @@ def census_blocks_filename(
     return filename
 
 
+@cache_project_config
 def census_blocks_url(
         fips_id: int,
         config: Optional[Config] = None
@@ -127,23 +144,24 @@ def census_blocks_url(
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        census_block_config = config["census_urls"]["census_blocks"]
+        census_urls = config["census_urls"]
+        census_block_config = census_urls["census_blocks"]
         url_directory_template = census_block_config["directory_template"]
-        url_directory = url_directory_template.format(
-            directory_year = census_block_config["directory_year"],
-            census_year_short = config["census_urls"]["census_year_short"],
+        url_directory = url_directory_template.format_map(
+            collections.ChainMap(
+                {"census_year_short": census_urls["census_year_short"]},
+                census_block_config,
+            )
         )
-        filename = census_blocks_filename(fips_id)
-        url = urllib.parse.urljoin(url_directory,filename)
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(url, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        filename = census_blocks_filename(fips_id, config)
+        # The configured URL directories all end with a slash, so the
+        # filename can be appended directly without parsing the URL.
+        url = f"{url_directory}{filename}"
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("census blocks url") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -151,6 +169,7 @@ def census_blocks_url(
     return url
 
 
+@cache_project_config
 def census_blocks_location(
         fips_id: int,
         config: Optional[Config] = None
@@ -170,13 +189,11 @@ def census_blocks_location(
         Configured relative pathname for the census block file
 
     """
-    # Ensure there is a configuration dictionary.
-    config = ensure_config(config)
-
     # The location of the file is a join of two other configured strings.
-    # Any errors will be raised within these functions.
-    location = os.path.join(
-        census_blocks_directory(config),
-        census_blocks_filename(fips_id, config)
-    )
+    # Any errors will be raised within these functions, which also take care
+    # of ensuring there is a configuration dictionary, so the config is
+    # passed through as given.
+    directory = census_blocks_directory(config)
+    filename = census_blocks_filename(fips_id, config)
+    location = f"{directory}{os.sep}{filename}"
     return location
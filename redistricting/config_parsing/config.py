@@ -1,10 +1,19 @@
 """Ultilities to support reading the configuration file."""
 
-import tomllib
-from typing import Optional, TypedDict, cast
+import functools
+import inspect
+from collections.abc import Callable
+from typing import Any, Optional, ParamSpec, TypedDict, TypeVar, cast
 
 CONFIG = "config.toml"
 
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+# Functions that clear a cache of values computed from the project config
+# file. clear_config_cache() calls all of them.
+_CACHE_CLEARERS: list[Callable[[], None]] = []
+
 
 class CleanedTablesConfig(TypedDict):
     """A dictionary to represent the cleaned tables configuration settings."""
@@ -43,17 +52,49 @@ class Config(TypedDict):
 class ConfigParseError(Exception):
     """Error class to suggest that the config file is misformed."""
 
+    __slots__ = ("config_key",)
+
     def __init__(self, config_key: str) -> None:
-        super().__init__(
-            f"Could not retrieve {config_key} from configuration file."
-        )
+        # Only the key is kept. The message is built when the error is
+        # displayed, which most raised errors never are.
+        self.config_key = config_key
+
+    def __str__(self) -> str:
+        """Describe which configuration option could not be retrieved."""
+        return f"Could not retrieve {self.config_key} from configuration file."
+
+
+@functools.cache
+def _load_config() -> Config:
+    """Open the project config file and parse it.
+
+    The file is only read once per process; the parsed dictionary is shared
+    by every later call. Use clear_config_cache() to force a re-read.
+
+    Returns
+    -------
+    config: dict
+        Configuration dictionary
+
+    """
+    # tomllib is only needed the one time the file is read, so it is
+    # imported here rather than whenever the package is imported.
+    import tomllib  # noqa: PLC0415
+
+    with open(CONFIG, "rb") as config_file:
+        # This cast a possible point of failure. However, it should pass
+        # silently at runtime as it is purely for type checking. Any
+        # parsing errors will be handled later on in the individual
+        # parsing functions.
+        return cast(Config, tomllib.load(config_file))
 
 
 def ensure_config(config: Optional[Config] = None) -> Config:
     """Ensure a config file is defined.
 
     Check if config dictionary already defined. If so, return that dictionary.
-    Otherwise, open config file, read it, and return the new dictionary.
+    Otherwise, return the project config file, which is parsed once and then
+    shared, so callers must not modify the returned dictionary.
 
     Parameters
     ----------
@@ -66,16 +107,77 @@ def ensure_config(config: Optional[Config] = None) -> Config:
         Configuration dictionary
 
     """
-    # If there is no configuration dictionary already defined, open the
-    # config file for the project and parse it.
-    if not config:
-        with open(CONFIG, "rb") as config_file:
-            # This cast a possible point of failure. However, it should pass
-            # silently at runtime as it is purely for type checking. Any
-            # parsing errors will be handled later on in the individual
-            # parsing functions.
-            config = cast(Config, tomllib.load(config_file))
-
-    # Either pass the orignial config dictionary through, or return the newly
-    # parsed configurarion dictionary.
+    # Either pass the orignial config dictionary through, or return the
+    # parsed configuration file for the project. Only a missing config falls
+    # back to the file; an empty dictionary is passed through like any other.
+    if config is None:
+        return _load_config()
     return config
+
+
+def register_cache_clearer(clearer: Callable[[], None]) -> None:
+    """Have clear_config_cache() also call the given function.
+
+    Parameters
+    ----------
+    clearer : Callable[[], None]
+        Function clearing values computed from the project config file
+
+    """
+    _CACHE_CLEARERS.append(clearer)
+
+
+def clear_config_cache() -> None:
+    """Forget the project config file and every value computed from it.
+
+    The next access reads the file again. Use this if the file changes while
+    the program is running.
+
+    """
+    _load_config.cache_clear()
+    for clearer in _CACHE_CLEARERS:
+        clearer()
+
+
+def cache_project_config(accessor: Callable[_P, _T]) -> Callable[_P, _T]:
+    """Cache the results of a config accessor for the project config file.
+
+    Results for the project config file never change during a run, so when
+    the accessor is called without a config it is computed once per set of
+    arguments and cached, until clear_config_cache() is called. Calls with
+    an explicit config dictionary are passed straight through.
+
+    Parameters
+    ----------
+    accessor : Callable
+        Accessor whose last parameter is an optional ``config``
+
+    Returns
+    -------
+    Callable
+        The accessor, with results for the project config file cached
+
+    """
+    # The config may be passed by position or by keyword, so its position
+    # is looked up once here rather than binding arguments on every call.
+    position = list(inspect.signature(accessor).parameters).index("config")
+    call = cast(Callable[..., _T], accessor)
+
+    @functools.cache
+    def project_value(*args: Any, **kwargs: Any) -> _T:
+        return call(*args, config=_load_config(), **kwargs)
+
+    register_cache_clearer(project_value.cache_clear)
+
+    @functools.wraps(accessor)
+    def cached_accessor(*args: _P.args, **kwargs: _P.kwargs) -> _T:
+        keywords = cast(dict[str, Any], kwargs)
+        config = (
+            args[position] if len(args) > position
+            else keywords.pop("config", None)
+        )
+        if config is None:
+            return project_value(*args[:position], **keywords)
+        return call(*args[:position], config=config, **keywords)
+
+    return cached_accessor
@@ -4,9 +4,11 @@ import os
 
 from typing import Optional
 
-from .config import Config, ConfigParseError, ensure_config
+from .config import Config, ConfigParseError
+from .config import cache_project_config, ensure_config
 
 
+@cache_project_config
 def country_data_directory(config: Optional[Config] = None) -> str:
     """Return directory for processed US population lookup table.
 
@@ -29,19 +31,17 @@ def country_data_directory(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        directory = os.path.join(
-            config["saved_data"]["directory"],
-            config["saved_data"]["cleaned_tables"]["directory"],
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(directory, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        saved_data = config["saved_data"]
+        data_directory = saved_data["directory"]
+        subdirectory = saved_data["cleaned_tables"]["directory"]
+        # An f-string always produces a string, so no further check on the
+        # type of the directory is needed.
+        directory = f"{data_directory}{os.sep}{subdirectory}"
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("country data directory") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -49,6 +49,7 @@ def country_data_directory(config: Optional[Config] = None) -> str:
     return directory
 
 
+@cache_project_config
 def country_data_filename(config: Optional[Config] = None) -> str:
     """Return filename for processed US population lookup table.
 
@@ -71,18 +72,14 @@ def country_data_filename(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        filename = os.path.join(
-            config["saved_data"]["cleaned_tables"]["country_data"]["filename"],
+        filename = (
+            config["saved_data"]["cleaned_tables"]["country_data"]["filename"]
         )
 
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(filename, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("country data filename") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -90,6 +87,7 @@ def country_data_filename(config: Optional[Config] = None) -> str:
     return filename
 
 
+@cache_project_config
 def country_data_location(config: Optional[Config] = None) -> str:
     """Return relative filename for processed US population lookup table.
 
@@ -104,13 +102,11 @@ def country_data_location(config: Optional[Config] = None) -> str:
         Configured relative pathname for the state population lookup table
 
     """
-    # Ensure there is a configuration dictionary.
-    config = ensure_config(config)
-
     # The location of the file is a join of two other configured strings.
-    # Any errors will be raised within these functions.
-    location = os.path.join(
-        country_data_directory(config),
-        country_data_filename(config)
-    )
+    # Any errors will be raised within these functions, which also take care
+    # of ensuring there is a configuration dictionary, so the config is
+    # passed through as given.
+    directory = country_data_directory(config)
+    filename = country_data_filename(config)
+    location = f"{directory}{os.sep}{filename}"
     return location
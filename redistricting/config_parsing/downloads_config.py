@@ -4,8 +4,10 @@ import os
 
 from typing import Optional
 
-from .config import Config, ConfigParseError, ensure_config
+from .config import Config, ConfigParseError
+from .config import cache_project_config, ensure_config
 
+@cache_project_config
 def downloads_directory(config: Optional[Config] = None) -> str:
     """Return configured downloads directory for project.
 
@@ -33,19 +35,17 @@ def downloads_directory(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        directory = os.path.join(
-            config["saved_data"]["directory"],
-            config["saved_data"]["downloads"]["directory"],
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(directory, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        saved_data = config["saved_data"]
+        data_directory = saved_data["directory"]
+        subdirectory = saved_data["downloads"]["directory"]
+        # An f-string always produces a string, so no further check on the
+        # type of the directory is needed.
+        directory = f"{data_directory}{os.sep}{subdirectory}"
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("downloads directory") from exc
 
     # If these actions have succeeded, then we have string configured from
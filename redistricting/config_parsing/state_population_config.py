@@ -1,55 +1,21 @@
 """Utilities for parsing state population configuration."""
 
 import os
-import urllib.parse
 
 from typing import Optional
 
-from .config import Config, ConfigParseError, ensure_config
+from .config import Config, ConfigParseError
+from .config import cache_project_config, ensure_config
+from .downloads_config import downloads_directory
 
 
-def state_population_directory(config: Optional[Config] = None) -> str:
-    """Return directory for the census state population file.
-
-    Parameters
-    ----------
-    config : Optional[dict]
-        Optional configuration dictionary
-
-    Returns
-    -------
-    str
-        Configured directory for the state populations
-
-    """
-    # Ensure there is a configuration dictionary.
-    config = ensure_config(config)
-
-    # Try to create a string from the expected configuration options.
-    # If not, return an error saying which configuration option failed.
-    try:
-        # A KeyError may occur here if the string keys do not match the file
-        # specified in the CONFIG constant above.
-        directory = os.path.join(
-            config["saved_data"]["directory"],
-            config["saved_data"]["downloads"]["directory"],
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(directory, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
-        raise ConfigParseError("state population directory") from exc
-
-    # If these actions have succeeded, then we have string configured from
-    # our project.
-    return directory
+# The apportionment population tables are saved alongside the other
+# downloads, so their directory is exactly the downloads directory. Alias the
+# function rather than building and caching the same path under another name.
+state_population_directory = downloads_directory
 
 
+@cache_project_config
 def state_population_filename(config: Optional[Config] = None) -> str:
     """Return the directory for the census state population file.
 
@@ -72,22 +38,17 @@ def state_population_filename(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        filename_template = \
-            config["census_urls"]\
-                  ["apportionment_population"]\
-                  ["states_filename_template"]
-        filename = filename_template.format(
-            census_year = config["census_urls"]["census_year"]
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(filename, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        census_urls = config["census_urls"]
+        population_config = census_urls["apportionment_population"]
+        filename_template = population_config["states_filename_template"]
+        # The template fields are all keys of the census_urls section, so
+        # that section is used as the mapping of values to substitute.
+        filename = filename_template.format_map(census_urls)
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("state population filename") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -95,6 +56,7 @@ def state_population_filename(config: Optional[Config] = None) -> str:
     return filename
 
 
+@cache_project_config
 def state_population_url(config: Optional[Config] = None) -> str:
     """Return the census url for the census state population file.
 
@@ -117,23 +79,20 @@ def state_population_url(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        url_directory_template = config["census_urls"] \
-                                       ["apportionment_population"] \
-                                       ["directory_template"]
-        url_directory = url_directory_template.format(
-            census_year = config["census_urls"]["census_year"]
-        )
-        filename = state_population_filename()
-        url = urllib.parse.urljoin(url_directory,filename)
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(url, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        census_urls = config["census_urls"]
+        population_config = census_urls["apportionment_population"]
+        url_directory_template = population_config["directory_template"]
+        url_directory = url_directory_template.format_map(census_urls)
+        filename = state_population_filename(config)
+
+        # The configured URL directories all end with a slash, so the
+        # filename can be appended directly without parsing the URL.
+        url = f"{url_directory}{filename}"
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("state population url") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -141,6 +100,7 @@ def state_population_url(config: Optional[Config] = None) -> str:
     return url
 
 
+@cache_project_config
 def state_population_location(config: Optional[Config] = None) -> str:
     """Return full relative filename for the census state population file.
 
@@ -155,13 +115,11 @@ def state_population_location(config: Optional[Config] = None) -> str:
         Configured relative pathname for the state populations.
 
     """
-    # Ensure there is a configuration dictionary.
-    config = ensure_config(config)
-
     # The location of the file is a join of two other configured strings.
-    # Any errors will be raised within these functions.
-    location = os.path.join(
-        state_population_directory(config),
-        state_population_filename(config)
-    )
+    # Any errors will be raised within these functions, which also take care
+    # of ensuring there is a configuration dictionary, so the config is
+    # passed through as given.
+    directory = state_population_directory(config)
+    filename = state_population_filename(config)
+    location = f"{directory}{os.sep}{filename}"
     return location
@@ -4,55 +4,18 @@ import os
 
 from typing import Optional
 
-from .config import Config, ConfigParseError, ensure_config
+from .config import Config, ConfigParseError
+from .config import cache_project_config, ensure_config
+from .downloads_config import downloads_directory
 
-def state_shapes_directory(config: Optional[Config] = None) -> str:
-    """Return the directory for the census state shape file.
 
-    Parameters
-    ----------
-    config : Optional[dict]
-        Optional configuration dictionary
-
-    Returns
-    -------
-    str
-        Configured directory for the state shapes
-
-    Raises
-    ------
-    ConfigParseError
-        There is a mismatch between the keys expected and the config file
-
-    """
-    # Ensure there is a configuration dictionary.
-    config = ensure_config(config)
-
-    # Try to create a string from the expected configuration options.
-    # If not, return an error saying which configuration option failed.
-    try:
-        # A KeyError may occur here if the string keys do not match the file
-        # specified in the CONFIG constant above.
-        directory = os.path.join(
-            config["saved_data"]["directory"],
-            config["saved_data"]["downloads"]["directory"]
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(directory, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
-        raise ConfigParseError("state shapes directory") from exc
-
-    # If these actions have succeeded, then we have string configured from
-    # our project.
-    return directory
+# The census state shapefile is saved alongside the other downloads, so
+# its directory is exactly the downloads directory. Alias the function
+# rather than building and caching the same path under another name.
+state_shapes_directory = downloads_directory
 
 
+@cache_project_config
 def state_shapes_filename(config: Optional[Config] = None) -> str:
     """Return the filename the census state shape file.
 
@@ -80,23 +43,16 @@ def state_shapes_filename(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        filename_template = \
-            config["census_urls"]["state_shapes"]["filename_template"]
-        filename = filename_template.format(
-            directory_year = \
-                config["census_urls"]["state_shapes"]["directory_year"],
-            shape_resolution = \
-                config["census_urls"]["state_shapes"]["shape_resolution"],
-        )
-
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(filename, str)
-
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+        state_shapes_config = config["census_urls"]["state_shapes"]
+        filename_template = state_shapes_config["filename_template"]
+        # The template fields are all keys of this section, so the section
+        # itself is used as the mapping of values to substitute.
+        filename = filename_template.format_map(state_shapes_config)
+
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("state shapes filename") from exc
 
     # If these actions have succeeded, then we have string configured from
@@ -104,6 +60,7 @@ def state_shapes_filename(config: Optional[Config] = None) -> str:
     return filename
 
 
+@cache_project_config
 def state_shapes_url(config: Optional[Config] = None) -> str:
     """Return the census URL for the census state shape file.
 
@@ -131,28 +88,29 @@ def state_shapes_url(config: Optional[Config] = None) -> str:
     try:
         # A KeyError may occur here if the string keys do not match the file
         # specified in the CONFIG constant above.
-        url_directory_template = \
-            config["census_urls"]["state_shapes"]["directory_template"]
-        url_directory = url_directory_template.format(
-            directory_year = \
-                config["census_urls"]["state_shapes"]["directory_year"]
+        state_shapes_config = config["census_urls"]["state_shapes"]
+        url_directory_template = state_shapes_config["directory_template"]
+        url_directory = url_directory_template.format_map(
+            state_shapes_config
         )
+        filename = state_shapes_filename(config)
 
-        # os.path.join does not guarantee it returns a string. Assert that it
-        # has done so.
-        assert isinstance(url_directory, str)
+        # The configured URL directories all end with a slash, so the
+        # filename can be appended directly without parsing the URL.
+        url = f"{url_directory}{filename}"
 
-    # If either of the two operations above failed, then there was an issue
-    # parsing the configuration dictionary. The user should check that it
-    # is correctly written
-    except (KeyError, AssertionError) as exc:
+    # If a lookup above failed, then there was an issue parsing the
+    # configuration dictionary. The user should check that it is correctly
+    # written
+    except KeyError as exc:
         raise ConfigParseError("state shapes url") from exc
 
     # If these actions have succeeded, then we have string configured from
     # our project.
-    return url_directory
+    return url
 
 
+@cache_project_config
 def state_shapes_location(config: Optional[Config] = None) -> str:
     """Return full relative filename for the census state population file.
 
@@ -167,13 +125,11 @@ def state_shapes_location(config: Optional[Config] = None) -> str:
         Configured relative pathname for the state shapes
 
     """
-    # Ensure there is a configuration dictionary.
-    config = ensure_config(config)
-
     # The location of the file is a join of two other configured strings.
-    # Any errors will be raised within these functions.
-    location = os.path.join(
-        state_shapes_directory(config),
-        state_shapes_filename(config)
-    )
+    # Any errors will be raised within these functions, which also take care
+    # of ensuring there is a configuration dictionary, so the config is
+    # passed through as given.
+    directory = state_shapes_directory(config)
+    filename = state_shapes_filename(config)
+    location = f"{directory}{os.sep}{filename}"
     return location
@@ -1,14 +1,44 @@
 """Utilities for downloading census files."""
 
+import contextlib
+import email.utils
+import functools
+import urllib.error
 import urllib.request
 import os.path
+import shutil
+import tempfile
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from typing import Optional
 
 from . import config_parsing
 
+# Bytes copied at a time when downloading a file.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-def download_file(url: str, destination: str) -> None:
+# Most files downloaded at once. The census blocks all come from the same
+# server, so this is kept modest rather than scaled to the processor count.
+MAX_DOWNLOAD_THREADS = 8
+
+# Local paths of census files known to be present in this process.
+_VERIFIED_FILES: set[str] = set()
+
+# Permissions for downloaded files, matching what open() would give a new
+# file. The umask can only be read by setting it, so this is done once on
+# import rather than while other threads may be creating files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_DOWNLOAD_FILE_MODE = 0o666 & ~_UMASK
+
+
+def download_file(
+        url: str,
+        destination: str,
+        if_modified_since: Optional[float] = None
+    ) -> bool:
     """Download a web file's data into a local file.
 
     Parameters
@@ -17,21 +47,70 @@ def download_file(url: str, destination: str) -> None:
         URL of the desired file
     destination : str
         Filename to save project to
+    if_modified_since : Optional[float]
+        Only download the file if it has changed since this time, given in
+        seconds since the epoch
+
+    Returns
+    -------
+    bool
+        Whether the file was downloaded. This is False only when the server
+        reports the file has not changed since if_modified_since.
 
     """
-    with (
-        open(destination, "wb+") as local_file,
-        urllib.request.urlopen(url) as web_file,
-    ):
-        local_file.write(web_file.read())
+    # Ask the server to skip sending the file if it has not changed, which
+    # it reports with a 304 Not Modified status.
+    request = urllib.request.Request(url)
+    if if_modified_since is not None:
+        request.add_header(
+            "If-Modified-Since",
+            email.utils.formatdate(if_modified_since, usegmt=True),
+        )
 
+    # The URL is opened before the destination so that the local file is
+    # left alone when there is nothing new to write to it.
+    try:
+        web_file = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as exc:
+        if exc.code == HTTPStatus.NOT_MODIFIED:
+            return False
+        raise
 
-def ensure_census_file(
+    # The file is written beside its destination under a temporary name and
+    # only renamed into place once complete. An interrupted download then
+    # never leaves a truncated file that would later be taken as present.
+    # Each download gets its own temporary file, so that two downloads of
+    # the same file, from different threads or processes, never write into
+    # or rename away each other's data.
+    directory, filename = os.path.split(destination)
+    file_descriptor, temp_path = tempfile.mkstemp(
+        suffix=".part", prefix=f".{filename}.", dir=directory or None
+    )
+    try:
+        # Census block files can be hundreds of megabytes, so the file is
+        # copied across in chunks rather than read into memory whole.
+        with web_file, os.fdopen(file_descriptor, "wb") as local_file:
+            shutil.copyfileobj(web_file, local_file, DOWNLOAD_CHUNK_SIZE)
+
+        # Temporary files are only readable by their owner. The downloaded
+        # file is given the permissions a plain new file would have.
+        os.chmod(temp_path, _DOWNLOAD_FILE_MODE)
+        os.replace(temp_path, destination)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+    return True
+
+
+def ensure_census_file(  # noqa: PLR0913
         directory: str,
         filename: str,
         url: str,
         redownload: bool = False,
-        interactive: bool = False
+        interactive: bool = False,
+        *,
+        refresh: bool = False
     ) -> bool:
     """Ensure that a file exists.
 
@@ -49,6 +128,9 @@ def ensure_census_file(
         Whether we want to redownload the file if it already exists
     interactive : bool
         Whether to ask the user to download a missing file
+    refresh : bool
+        Whether to download the file again if the census copy has changed
+        since it was saved. Unlike redownload, an unchanged file is kept.
 
     Returns
     -------
@@ -56,31 +138,66 @@ def ensure_census_file(
         Whether the specified file exists now
 
     """
-    # Check if directory exists already. If not, make it.
+    # Files already found or downloaded during this run are not checked on
+    # disk again unless a fresh copy is wanted.
+    destination = os.path.join(directory, filename)
+    if destination in _VERIFIED_FILES and not (redownload or refresh):
+        return True
+
+    # A single stat tells us whether the file is there and usable. An empty
+    # file is left behind by an interrupted download, so it is treated as
+    # missing rather than trusted forever.
     try:
-        os.makedirs(directory)
-    except OSError:
-        pass
-    else:
+        file_stat: Optional[os.stat_result] = os.stat(destination)
+    except FileNotFoundError:
+        file_stat = None
+    file_exists = file_stat is not None and file_stat.st_size > 0
+
+    # A missing file may also mean a missing directory. If so, make it.
+    # Another thread may create it in between, so an existing directory is
+    # not an error, but any other failure to create it is.
+    if file_stat is None and not os.path.isdir(directory):
+        os.makedirs(directory, exist_ok=True)
         print(f"Created directory: {directory}")
 
-    # Check if file exists. If not, or if redownload is wanted, download it.
-    destination = os.path.join(directory, filename)
-    if not os.path.isfile(destination) or redownload:
+    # If the file is missing, or if redownload is wanted, download it.
+    if not file_exists or redownload:
         if interactive and not redownload:
             download_wanted = input(
                 f"{destination} not found. Download it? [y/n]? "
             )
-            if download_wanted not in ["y", "Y", "yes", "Yes", "YES"]:
+            if download_wanted.strip().lower() not in {"y", "yes"}:
                 return False
+
         print(f"Downloading {destination}.")
         download_file(url, destination)
+
+    # If a refresh is wanted, the existing file is only downloaded again if
+    # the census has changed it since it was last saved.
+    elif refresh and file_stat is not None:
+        print(f"Checking {destination} for updates.")
+        if download_file(url, destination, file_stat.st_mtime):
+            print(f"Downloaded {destination}.")
+        else:
+            print(f"{destination} is already up to date.")
+    _VERIFIED_FILES.add(destination)
     return True
 
 
+def forget_verified_files() -> None:
+    """Make ensure_census_file check every file on disk again.
+
+    Use this if census files may have been removed since they were last
+    ensured in this process.
+
+    """
+    _VERIFIED_FILES.clear()
+
+
 def ensure_state_shapes(
         redownload: bool = False,
-        config: Optional[config_parsing.Config] = None
+        config: Optional[config_parsing.Config] = None,
+        refresh: bool = False
     ) -> None:
     """Ensure we have the state shape file from the census.
 
@@ -90,19 +207,22 @@ def ensure_state_shapes(
         Whether we want to redownload the file if it already exists
     config : Optional[dict]
         Optional configuration dictionary
+    refresh : bool
+        Whether to download the file again if the census copy has changed
 
     """
-    config = config_parsing.ensure_config(config)
     ensure_census_file(
         config_parsing.state_shapes_directory(config),
         config_parsing.state_shapes_filename(config),
         config_parsing.state_shapes_url(config),
-        redownload=redownload
+        redownload=redownload,
+        refresh=refresh
     )
 
 def ensure_fips_identifiers(
         redownload: bool = False,
-        config: Optional[config_parsing.Config] = None
+        config: Optional[config_parsing.Config] = None,
+        refresh: bool = False
     ) -> None:
     """Ensure we have the fips identifier table from the census.
 
@@ -112,21 +232,24 @@ def ensure_fips_identifiers(
         Whether we want to redownload the file if it already exists
     config : Optional[dict]
         Optional configuration dictionary
+    refresh : bool
+        Whether to download the file again if the census copy has changed
 
     """
-    config = config_parsing.ensure_config(config)
     ensure_census_file(
         config_parsing.fips_identifiers_directory(config),
         config_parsing.fips_identifiers_filename(config),
         config_parsing.fips_identifiers_url(config),
-        redownload=redownload
+        redownload=redownload,
+        refresh=refresh
     )
 
 
 def ensure_state_census_blocks(
         fips_id: int,
         redownload: bool = False,
-        config: Optional[config_parsing.Config] = None
+        config: Optional[config_parsing.Config] = None,
+        refresh: bool = False
     ) -> None:
     """Ensure we have the census block file for a state.
 
@@ -138,19 +261,22 @@ def ensure_state_census_blocks(
         Whether we want to redownload the file if it already exists
     config : Optional[dict]
         Optional configuration dictionary
+    refresh : bool
+        Whether to download the file again if the census copy has changed
 
     """
-    config = config_parsing.ensure_config(config)
     ensure_census_file(
         config_parsing.census_blocks_directory(config),
         config_parsing.census_blocks_filename(fips_id, config),
         config_parsing.census_blocks_url(fips_id, config),
-        redownload=redownload
+        redownload=redownload,
+        refresh=refresh
     )
 
 def ensure_state_population_table(
         redownload: bool = False,
-        config: Optional[config_parsing.Config] = None
+        config: Optional[config_parsing.Config] = None,
+        refresh: bool = False
     ) -> None:
     """Ensure we have the state population table from the census.
 
@@ -160,12 +286,96 @@ def ensure_state_population_table(
         Whether we want to redownload the file if it already exists
     config : Optional[dict]
         Optional configuration dictionary
+    refresh : bool
+        Whether to download the file again if the census copy has changed
 
     """
-    config = config_parsing.ensure_config(config)
     ensure_census_file(
         config_parsing.state_population_directory(config),
         config_parsing.state_population_filename(config),
         config_parsing.state_population_url(config),
-        redownload=redownload
+        redownload=redownload,
+        refresh=refresh
+    )
+
+
+def ensure_all_reference_files(
+        redownload: bool = False,
+        config: Optional[config_parsing.Config] = None,
+        refresh: bool = False
+    ) -> None:
+    """Ensure we have the state shapes, FIPS and population census files.
+
+    The three files are independent downloads, so they are fetched in
+    parallel threads rather than one after another.
+
+    Parameters
+    ----------
+    redownload : bool
+        Whether we want to redownload the files if they already exist
+    config : Optional[dict]
+        Optional configuration dictionary
+    refresh : bool
+        Whether to download the files again if the census copies have
+        changed
+
+    """
+    ensure_functions = (
+        ensure_state_shapes,
+        ensure_fips_identifiers,
+        ensure_state_population_table,
+    )
+    with ThreadPoolExecutor(max_workers=len(ensure_functions)) as executor:
+        futures = [
+            executor.submit(
+                ensure_file,
+                redownload=redownload,
+                config=config,
+                refresh=refresh,
+            )
+            for ensure_file in ensure_functions
+        ]
+
+    # Re-raise any error from a download in this thread.
+    for future in futures:
+        future.result()
+
+
+def ensure_many_state_census_blocks(
+        fips_ids: Iterable[int],
+        redownload: bool = False,
+        config: Optional[config_parsing.Config] = None,
+        max_workers: int = MAX_DOWNLOAD_THREADS,
+        refresh: bool = False
+    ) -> None:
+    """Ensure we have the census block files for several states.
+
+    Downloading is bound by the network rather than the processor, so the
+    states are fetched in parallel threads.
+
+    Parameters
+    ----------
+    fips_ids : Iterable[int]
+        The FIPS identifiers of the states
+    redownload : bool
+        Whether we want to redownload the files if they already exist
+    config : Optional[dict]
+        Optional configuration dictionary
+    max_workers : int
+        Most download threads to use
+    refresh : bool
+        Whether to download the files again if the census copies have
+        changed
+
+    """
+    ensure_blocks = functools.partial(
+        ensure_state_census_blocks,
+        redownload=redownload,
+        config=config,
+        refresh=refresh,
     )
+    # Each state is only downloaded once, however often it is listed.
+    unique_fips_ids = dict.fromkeys(int(fips_id) for fips_id in fips_ids)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consuming the results re-raises any error from a download.
+        list(executor.map(ensure_blocks, unique_fips_ids))
@@ -1,7 +1,8 @@
 """For the tranformation of raw geographical data into working dataframes."""
 
-from typing import cast
+import functools
 
+import numpy as np
 import pandas as pd
 import geopandas as gpd
 import pyproj
@@ -37,52 +38,88 @@ def census_block_centroids(
     if census_crs is None:
         raise TypeError
 
-    census_blocks = cast(gpd.GeoDataFrame,
-        # The Census already calculates an internal central point
-        # for all census blocks. Let's turn this information into
-        # our new geometry. Each block is now represented by this
-        # point in NAD83.
-        census_blocks.assign(
-            geometry=gpd.points_from_xy(
-                census_blocks.INTPTLON20,
-                census_blocks.INTPTLAT20,
-            )
-        )
-
-        # We only want to keep a few of the columns. GEOID is the
-        # key, which will let us join with the original census
-        # block data later.
-        [["GEOID20", "POP20", "geometry"]]
-
-        # Our ultimate goal! We want to group these blocks into
-        # districts, so we need a column to put them in. 0 will
-        # mean that we have not yet assigned the block to a
-        # district.
-        .assign(district=0)
+    # The Census stores each block's internal point as text. Parse the
+    # coordinates into float arrays once, in vectorized code, so that they
+    # can be used both for the new geometry and for the projection below.
+    longitude = pd.to_numeric(census_blocks.INTPTLON20).to_numpy(
+        dtype=np.float64
     )
-
-    census_blocks = cast(gpd.GeoDataFrame,
-        # The splitline processing will be done in the gnomonic
-        # crs, so we will store this information for later. It's
-        # easiest to convert our whole dataframe to our new CRS
-        # then store the results for later.
-        census_blocks
-        .to_crs(gnomonic_crs)
-        .assign(x=lambda gdf_: gdf_.geometry.x)
-        .assign(y=lambda gdf_: gdf_.geometry.y)
+    latitude = pd.to_numeric(census_blocks.INTPTLAT20).to_numpy(
+        dtype=np.float64
     )
 
-    census_blocks = (
-        # Ultimately, we want to store the centroid geometry in
-        # NAD83's latitude and longitude to facilitate further
-        # processing. So we need to convert back.
-        census_blocks
-        .to_crs(census_crs)
+    # The splitline processing will be done in the gnomonic crs, so we
+    # store each point's gnomonic coordinates for later. Only these
+    # coordinates are projected. The geometry is left in NAD83's latitude
+    # and longitude to facilitate further processing, rather than being
+    # converted to the gnomonic crs and back again.
+    transformer = _crs_transformer(census_crs, gnomonic_crs)
+    x, y = transformer.transform(longitude, latitude)
+
+    # The new dataframe is built in one go from these arrays, rather than
+    # by copying the very large census dataframe once per added column.
+    census_blocks = gpd.GeoDataFrame(
+        {
+            # We only want to keep a few of the columns. GEOID is the
+            # key, which will let us join with the original census
+            # block data later.
+            "GEOID20": census_blocks["GEOID20"].to_numpy(),
+            # Block populations are small and never negative, so they are
+            # stored in four bytes rather than eight. Cumulative sums
+            # over them are still taken in 64 bits.
+            "POP20": census_blocks["POP20"].to_numpy(dtype=np.uint32),
+
+            # The Census already calculates an internal central point
+            # for all census blocks. Let's turn this information into
+            # our new geometry. Each block is now represented by this
+            # point in NAD83.
+            "geometry": gpd.points_from_xy(
+                longitude, latitude, crs=census_crs
+            ),
+
+            # Our ultimate goal! We want to group these blocks into
+            # districts, so we need a column to put them in. 0 will
+            # mean that we have not yet assigned the block to a
+            # district. A state has far fewer districts than int16 can
+            # count.
+            "district": np.zeros(len(longitude), dtype=np.int16),
+
+            "x": x,
+            "y": y,
+        },
+        index=census_blocks.index,
+        crs=census_crs,
     )
 
     return census_blocks
 
 
+@functools.lru_cache(maxsize=8)
+def _crs_transformer(
+        from_crs: pyproj.CRS,
+        to_crs: pyproj.CRS
+    ) -> pyproj.Transformer:
+    """Return a transformer between two coordinate reference systems.
+
+    Building a transformer is expensive, so they are cached and reused
+    between calls with the same pair of CRSs.
+
+    Parameters
+    ----------
+    from_crs : pyproj.crs.crs.CRS
+        The CRS of the input coordinates
+    to_crs : pyproj.crs.crs.CRS
+        The CRS of the output coordinates
+
+    Returns
+    -------
+    pyproj.transformer.Transformer
+        A transformer taking (x, y) or (longitude, latitude) ordered input
+
+    """
+    return pyproj.Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
+
 def state_boundary(state_shape: gpd.GeoDataFrame) -> gpd.GeoSeries:
     """Find the boundary of a given state from its geographical shape.
 
@@ -112,10 +149,7 @@ def apportionment_drop_pr(states: pd.DataFrame) -> pd.DataFrame:
         Cleaned state populations table without Puerto Rico
 
     """
-    return (
-        states
-        [~states["ABBR"].isin(["PR"])]
-    )
+    return _drop_abbreviation(states, "PR")
 
 
 def apportionment_drop_dc(states: pd.DataFrame) -> pd.DataFrame:
@@ -132,7 +166,26 @@ def apportionment_drop_dc(states: pd.DataFrame) -> pd.DataFrame:
         Cleaned state populations table without DC
 
     """
-    return (
-        states
-        [~states["ABBR"].isin(["DC"])]
-    )
+    return _drop_abbreviation(states, "DC")
+
+
+def _drop_abbreviation(states: pd.DataFrame, abbr: str) -> pd.DataFrame:
+    """Drop a single 'state' from a table of state populations.
+
+    A direct inequality against one abbreviation is a plain vectorized
+    comparison, without the set construction and negation of `~isin`.
+
+    Parameters
+    ----------
+    states : pandas.core.frame.DataFrame
+        Cleaned state populations table
+    abbr : str
+        Postal abbreviation of the 'state' to drop
+
+    Returns
+    -------
+    pandas.core.frame.DataFrame
+        Cleaned state populations table without that 'state'
+
+    """
+    return states[states["ABBR"].ne(abbr)]
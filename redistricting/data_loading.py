@@ -1,4 +1,5 @@
 """Modules for loading a state's data from saved files."""
+import functools
 import os
 
 from typing import cast
@@ -27,7 +28,13 @@ def load_state_census_blocks(fips: int) -> gpd.GeoDataFrame:
 
     """
     data_acquisition.ensure_state_census_blocks(fips)
-    return gpd.read_file(config_parsing.census_blocks_location(fips))
+    # pyogrio reads the whole layer through GDAL in compiled code, rather
+    # than feature by feature through Python as fiona does. Every column is
+    # kept, since the districted output is the full census block table.
+    return gpd.read_file(
+        config_parsing.census_blocks_location(fips),
+        engine="pyogrio",
+    )
 
 
 def load_state_shape(fips: int) -> gpd.GeoDataFrame:
@@ -45,19 +52,63 @@ def load_state_shape(fips: int) -> gpd.GeoDataFrame:
 
     """
     data_acquisition.ensure_state_shapes()
-    state_shapes_raw = gpd.read_file(config_parsing.state_shapes_location())
-    state_shape = state_shapes_raw[
-        state_shapes_raw["STATEFP"] == str(fips).zfill(2)
-    ]
+    state_shapes_location = config_parsing.state_shapes_location()
+    # The nationwide shapes file is parsed once and reused for every state.
+    # The modification time is part of the cache key, so a redownloaded file
+    # is read again rather than served stale.
+    state_shapes_raw = _read_state_shapes(
+        state_shapes_location,
+        os.stat(state_shapes_location).st_mtime_ns,
+    )
+    # The cached table is indexed by FIPS code, so picking out one state is
+    # a hash lookup rather than a string comparison against every row. An
+    # unknown code still gives an empty table, as a mask would.
+    state_fips = str(fips).zfill(2)
+    if state_fips in state_shapes_raw.index:
+        state_shape = state_shapes_raw.loc[[state_fips]]
+    else:
+        state_shape = state_shapes_raw.iloc[:0]
     # Cast does nothing, but there's an open problem in geopandas/pandas
     # typing system that otherwise raises errors.
     state_shape = cast(gpd.GeoDataFrame, state_shape)
     return state_shape
 
 
+@functools.lru_cache(maxsize=2)
+def _read_state_shapes(path: str, mtime_ns: int) -> gpd.GeoDataFrame:
+    """Read and cache the nationwide state shapes file.
+
+    Parameters
+    ----------
+    path : str
+        Location of the state shapes file
+    mtime_ns : int
+        Modification time of the file, used only as part of the cache key
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+        The shapes of every state, indexed by FIPS code. Shared between
+        callers, so it must not be modified in place.
+
+    """
+    # Keep the STATEFP column as well, for callers that read it. The index
+    # is left unnamed so that merging or grouping on "STATEFP" still refers
+    # unambiguously to the column.
+    return (
+        gpd.read_file(path, engine="pyogrio")
+        .set_index("STATEFP", drop=False)
+        .rename_axis(None)
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def load_state_data() -> pd.DataFrame:
     """Load the state data table.
 
+    The table is read once and cached, so the returned dataframe is shared
+    between callers. Callers must not modify it in place.
+
     Returns
     -------
     pandas.core.frame.DataFrame
@@ -67,7 +118,14 @@ def load_state_data() -> pd.DataFrame:
     state_data_location = config_parsing.state_data_location()
     if not os.path.isfile(state_data_location):
         data_processing.create_state_data()
-    return pd.read_csv(state_data_location)
+
+    # State names and abbreviations are stored as categories, so lookups
+    # compare small integer codes rather than strings. FIPS ids fit in a
+    # single byte.
+    return pd.read_csv(
+        state_data_location,
+        dtype={"FIPS": "int8", "ABBR": "category", "STATE": "category"},
+    )
 
 
 def load_country_data() -> pd.DataFrame: